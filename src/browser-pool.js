@@ -0,0 +1,63 @@
+import puppeteer from 'puppeteer';
+
+// Single browser shared by all test runs in this process, launched on first use.
+// The pending promise is cached so concurrent callers wait for the same launch.
+let browserPromise = null;
+let isConnectedBrowser = false;
+
+async function launchBrowser(launchOptions) {
+  const browser = await puppeteer.launch(launchOptions);
+  // Other tester processes can attach to this browser with --cdp-endpoint
+  console.log(`Shared browser endpoint: ${browser.wsEndpoint()}`);
+  return browser;
+}
+
+async function connectBrowser(browserWSEndpoint) {
+  const browser = await puppeteer.connect({ browserWSEndpoint });
+  console.log(`Connected to browser: ${browserWSEndpoint}`);
+  return browser;
+}
+
+export function getBrowser(launchOptions, browserWSEndpoint = null) {
+  if (!browserPromise) {
+    isConnectedBrowser = Boolean(browserWSEndpoint);
+    const pendingBrowser = browserWSEndpoint
+      ? connectBrowser(browserWSEndpoint)
+      : launchBrowser(launchOptions);
+    const currentPromise = pendingBrowser.then((browser) => {
+      // Start a new browser on next use if this one crashes or the connection drops
+      browser.once('disconnected', () => {
+        if (browserPromise === currentPromise) {
+          browserPromise = null;
+        }
+      });
+      return browser;
+    }, (error) => {
+      browserPromise = null;
+      throw error;
+    });
+    browserPromise = currentPromise;
+  }
+  return browserPromise;
+}
+
+export async function closeBrowser() {
+  if (!browserPromise) {
+    return;
+  }
+
+  const pendingBrowser = browserPromise;
+  browserPromise = null;
+
+  try {
+    const browser = await pendingBrowser;
+    // A browser we connected to belongs to another process, so only detach from it
+    if (isConnectedBrowser) {
+      await browser.disconnect();
+    } else {
+      await browser.close();
+    }
+  } catch (error) {
+    // Ignore errors when the browser failed to launch or is already closed
+  }
+}
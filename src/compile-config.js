@@ -0,0 +1,21 @@
+#!/usr/bin/env node
+
+import { loadYamlCached } from './config-cache.js';
+
+// Parse the given config files ahead of time so test runs load them from the cache
+const configPaths = process.argv.slice(2);
+
+if (configPaths.length === 0) {
+  console.error('Usage: compile-config <config.yaml> [config.yaml...]');
+  process.exit(1);
+}
+
+for (const configPath of configPaths) {
+  try {
+    loadYamlCached(configPath);
+    console.log(`Compiled: ${configPath}`);
+  } catch (error) {
+    console.error(`Error compiling ${configPath}:`, error.message);
+    process.exitCode = 1;
+  }
+}
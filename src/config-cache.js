@@ -0,0 +1,95 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import crypto from 'crypto';
+import { createRequire } from 'module';
+
+// The YAML parser is only loaded on a cache miss, so warm runs never import it
+const require = createRequire(import.meta.url);
+
+const DEFAULT_CACHE_DIR = path.join(os.homedir(), '.cache', 'voice-agent-tester');
+
+// Configs already loaded by this process, keyed like the on-disk cache entries
+const MAX_LOADED_CONFIGS = 32;
+const loadedConfigs = new Map(); // Map of cache path -> cache entry
+
+function rememberEntry(cachePath, entry) {
+  loadedConfigs.delete(cachePath);
+  if (loadedConfigs.size >= MAX_LOADED_CONFIGS) {
+    // Maps keep insertion order, so the first key is the oldest entry
+    loadedConfigs.delete(loadedConfigs.keys().next().value);
+  }
+  loadedConfigs.set(cachePath, entry);
+  return entry.config;
+}
+
+// Each YAML file has a single cache entry, named after its path, which is
+// overwritten whenever the file changes
+function getCachePath(filePath, cacheDir) {
+  const hash = crypto.createHash('sha1').update(path.resolve(filePath)).digest('hex');
+  return path.join(cacheDir, `${hash}.json`);
+}
+
+// An entry is only valid for the modification time and size it was parsed from
+function isFresh(entry, stat) {
+  return Boolean(entry)
+    && entry.mtimeNs === String(stat.mtimeNs)
+    && entry.size === String(stat.size);
+}
+
+// JSON is a subset of YAML, so JSON files skip the YAML parser and use the native one
+function parseYaml(text) {
+  if (text.trimStart().startsWith('{')) {
+    try {
+      return JSON.parse(text);
+    } catch (error) {
+      // YAML flow mapping that is not valid JSON
+    }
+  }
+
+  const YAML = require('yaml');
+  return YAML.parse(text);
+}
+
+/**
+ * Loads a YAML file, reusing the result parsed earlier by this process or by a previous run
+ * when the file is unchanged. Callers share the returned object and must not modify it
+ * @param {string} filePath - Path to the YAML file
+ * @param {string} cacheDir - Folder where parsed files are stored
+ * @returns {any} - The parsed YAML content
+ */
+export function loadYamlCached(filePath, cacheDir = DEFAULT_CACHE_DIR) {
+  const stat = fs.statSync(filePath, { bigint: true });
+  const cachePath = getCachePath(filePath, cacheDir);
+
+  const loadedEntry = loadedConfigs.get(cachePath);
+  if (isFresh(loadedEntry, stat)) {
+    return loadedEntry.config;
+  }
+
+  if (fs.existsSync(cachePath)) {
+    try {
+      const cachedEntry = JSON.parse(fs.readFileSync(cachePath, 'utf8'));
+      if (isFresh(cachedEntry, stat)) {
+        return rememberEntry(cachePath, cachedEntry);
+      }
+    } catch (error) {
+      // Corrupted cache entry, parse the YAML file again
+    }
+  }
+
+  const entry = {
+    mtimeNs: String(stat.mtimeNs),
+    size: String(stat.size),
+    config: parseYaml(fs.readFileSync(filePath, 'utf8'))
+  };
+
+  try {
+    fs.mkdirSync(cacheDir, { recursive: true });
+    fs.writeFileSync(cachePath, JSON.stringify(entry), 'utf8');
+  } catch (error) {
+    // The cache is only an optimization, ignore write failures
+  }
+
+  return rememberEntry(cachePath, entry);
+}
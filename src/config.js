@@ -0,0 +1,58 @@
+import path from 'path';
+import { loadYamlCached } from './config-cache.js';
+
+// Helper function to check the steps once at load time instead of on every run
+function validateSteps(steps, configPath) {
+  if (!Array.isArray(steps)) {
+    throw new Error(`"steps" must be a list: ${configPath}`);
+  }
+
+  steps.forEach((step, index) => {
+    if (!step || typeof step.action !== 'string') {
+      throw new Error(`Step ${index + 1} must contain an "action" field: ${configPath}`);
+    }
+  });
+
+  return steps;
+}
+
+// Helper function to make a loaded config immutable, as the same config
+// objects are shared by every run (and every concurrent worker) that uses them
+function deepFreeze(value) {
+  if (value && typeof value === 'object' && !Object.isFrozen(value)) {
+    Object.values(value).forEach(deepFreeze);
+    Object.freeze(value);
+  }
+  return value;
+}
+
+// Helper function to load and validate application config
+export function loadApplicationConfig(configPath, cacheDir) {
+  const config = loadYamlCached(configPath, cacheDir) || {};
+
+  if (!config.url && !config.html) {
+    throw new Error(`Application config must contain "url" or "html" field: ${configPath}`);
+  }
+
+  return deepFreeze({
+    name: path.basename(configPath, path.extname(configPath)),
+    path: configPath,
+    url: config.url,
+    html: config.html,
+    steps: validateSteps(config.steps || [], configPath),
+    tags: config.tags || []
+  });
+}
+
+// Helper function to load and validate scenario config
+export function loadScenarioConfig(configPath, cacheDir) {
+  const config = loadYamlCached(configPath, cacheDir) || {};
+
+  return deepFreeze({
+    name: path.basename(configPath, path.extname(configPath)),
+    path: configPath,
+    steps: validateSteps(config.steps || [], configPath),
+    background: config.background || null,
+    tags: config.tags || []
+  });
+}
@@ -5,10 +5,11 @@ import path from 'path';
 import { fileURLToPath } from 'url';
 import yargs from 'yargs';
 import { hideBin } from 'yargs/helpers';
-import YAML from 'yaml';
 import { VoiceAgentTester } from './voice-agent-tester.js';
 import { ReportGenerator } from './report.js';
 import { createServer } from './server.js';
+import { closeBrowser } from './browser-pool.js';
+import { loadApplicationConfig, loadScenarioConfig } from './config.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -25,9 +26,9 @@ function resolveConfigPaths(input) {
       const stat = fs.statSync(resolvedPath);
 
       if (stat.isDirectory()) {
-        // If it's a directory, find all .yaml files
+        // If it's a directory, find all .yaml files (and .json files, which are valid YAML)
         const files = fs.readdirSync(resolvedPath)
-          .filter(f => f.endsWith('.yaml') || f.endsWith('.yml'))
+          .filter(f => f.endsWith('.yaml') || f.endsWith('.yml') || f.endsWith('.json'))
           .map(f => path.join(resolvedPath, f));
         paths.push(...files);
       } else if (stat.isFile()) {
@@ -41,39 +42,6 @@ function resolveConfigPaths(input) {
   return paths;
 }
 
-// Helper function to load and validate application config
-function loadApplicationConfig(configPath) {
-  const configFile = fs.readFileSync(configPath, 'utf8');
-  const config = YAML.parse(configFile);
-
-  if (!config.url && !config.html) {
-    throw new Error(`Application config must contain "url" or "html" field: ${configPath}`);
-  }
-
-  return {
-    name: path.basename(configPath, path.extname(configPath)),
-    path: configPath,
-    url: config.url,
-    html: config.html,
-    steps: config.steps || [],
-    tags: config.tags || []
-  };
-}
-
-// Helper function to load scenario config
-function loadScenarioConfig(configPath) {
-  const configFile = fs.readFileSync(configPath, 'utf8');
-  const config = YAML.parse(configFile);
-
-  return {
-    name: path.basename(configPath, path.extname(configPath)),
-    path: configPath,
-    steps: config.steps || [],
-    background: config.background || null,
-    tags: config.tags || []
-  };
-}
-
 // Parse command-line arguments
 const argv = yargs(hideBin(process.argv))
   .option('applications', {
@@ -107,7 +75,7 @@ const argv = yargs(hideBin(process.argv))
   })
   .option('repeat', {
     type: 'number',
-    description: 'Number of repetitions to run each app+scenario combination (closes and recreates browser for each)',
+    description: 'Number of repetitions to run each app+scenario combination (each in a fresh browser context)',
     default: 1
   })
   .option('headless', {
@@ -128,7 +96,7 @@ const argv = yargs(hideBin(process.argv))
   .option('concurrency', {
     alias: 'c',
     type: 'number',
-    description: 'Number of tests to run in parallel',
+    description: 'Number of tests to run in parallel (0 runs all tests at once)',
     default: 1
   })
   .option('record', {
@@ -136,6 +104,16 @@ const argv = yargs(hideBin(process.argv))
     description: 'Record video and audio of the test in webm format',
     default: false
   })
+  .option('reuse-browser', {
+    type: 'boolean',
+    description: 'Share a single browser across test runs instead of launching one per run (ignored with --record)',
+    default: true
+  })
+  .option('cdp-endpoint', {
+    type: 'string',
+    description: 'WebSocket endpoint of a running browser to share instead of launching one (ignored with --record)',
+    default: null
+  })
   .help()
   .argv;
 
@@ -161,8 +139,8 @@ async function main() {
     }
 
     // Load all application and scenario configs
-    let applications = applicationPaths.map(loadApplicationConfig);
-    let scenarios = scenarioPaths.map(loadScenarioConfig);
+    let applications = applicationPaths.map(configPath => loadApplicationConfig(configPath));
+    let scenarios = scenarioPaths.map(configPath => loadScenarioConfig(configPath));
 
     // Filter applications by tags if specified
     if (argv.applicationTags) {
@@ -204,6 +182,29 @@ async function main() {
     // Create a single report generator for metrics tracking
     const reportGenerator = new ReportGenerator(argv.report || 'temp_metrics.csv');
 
+    // Helper function to write an application's HTML to a temporary file and serve it
+    async function serveHtml(app) {
+      const assetsDir = path.join(__dirname, '..', 'assets');
+      await fs.promises.mkdir(assetsDir, { recursive: true });
+      const tempHtmlPath = path.join(assetsDir, `temp_${app.name}_${Date.now()}.html`);
+      await fs.promises.writeFile(tempHtmlPath, app.html, 'utf8');
+      tempHtmlPaths.push(tempHtmlPath);
+      return `${argv.assetsServer}/assets/${path.basename(tempHtmlPath)}`;
+    }
+
+    // Helper function to serve each application's HTML once and reuse the same URL for
+    // all its runs, so its temporary file is written once per application instead of once per run
+    const htmlUrls = new Map(); // Map of application path -> Promise of HTML URL
+    function getHtmlUrl(app) {
+      if (!htmlUrls.has(app.path)) {
+        const htmlUrl = serveHtml(app);
+        // Retry on the next run if the file could not be written
+        htmlUrl.catch(() => htmlUrls.delete(app.path));
+        htmlUrls.set(app.path, htmlUrl);
+      }
+      return htmlUrls.get(app.path);
+    }
+
     // Helper function to execute a single test run
     async function executeRun({ app, scenario, repetition, runNumber }) {
       console.log(`\n${'='.repeat(80)}`);
@@ -217,18 +218,9 @@ async function main() {
 
       // Handle HTML content vs URL
       let targetUrl;
-      let tempHtmlPath = null;
 
       if (app.html) {
-        // Create temporary HTML file and serve it
-        const assetsDir = path.join(__dirname, '..', 'assets');
-        if (!fs.existsSync(assetsDir)) {
-          fs.mkdirSync(assetsDir, { recursive: true });
-        }
-        tempHtmlPath = path.join(assetsDir, `temp_${app.name}_${Date.now()}.html`);
-        fs.writeFileSync(tempHtmlPath, app.html, 'utf8');
-        tempHtmlPaths.push(tempHtmlPath);
-        targetUrl = `${argv.assetsServer}/assets/${path.basename(tempHtmlPath)}`;
+        targetUrl = await getHtmlUrl(app);
         console.log(`HTML content served at: ${targetUrl}`);
       } else {
         targetUrl = app.url;
@@ -243,7 +235,9 @@ async function main() {
         headless: argv.headless,
         assetsServerUrl: argv.assetsServer,
         reportGenerator: reportGenerator,
-        record: argv.record
+        record: argv.record,
+        reuseBrowser: argv.reuseBrowser,
+        cdpEndpoint: argv.cdpEndpoint
       });
 
       try {
@@ -280,7 +274,9 @@ async function main() {
     }
 
     // Execute runs with concurrency limit using a worker pool
-    const concurrency = Math.min(argv.concurrency || 1, allRuns.length);
+    // A concurrency of 0 starts every run at once
+    const requestedConcurrency = argv.concurrency === 0 ? allRuns.length : (argv.concurrency || 1);
+    const concurrency = Math.min(requestedConcurrency, allRuns.length);
     console.log(`⚡ Concurrency level: ${concurrency}`);
 
     // Worker pool implementation - start new tests as soon as one finishes
@@ -360,6 +356,9 @@ async function main() {
     console.error('Error running scenarios:', error.message);
     exitCode = 1;
   } finally {
+    // Close the shared browser once all runs are done
+    await closeBrowser();
+
     // Clean up temporary HTML files if created
     for (const tempHtmlPath of tempHtmlPaths) {
       if (fs.existsSync(tempHtmlPath)) {
@@ -6,20 +6,30 @@ import OpenAI from 'openai';
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
+// Single client shared by all transcriptions and evaluations so HTTP connections are reused
+let openaiClient = null;
+
+function getOpenAIClient() {
+  if (!openaiClient) {
+    openaiClient = new OpenAI({
+      apiKey: process.env.OPENAI_API_KEY
+    });
+  }
+  return openaiClient;
+}
+
 /**
  * Transcribes audio using OpenAI Whisper API
  * @param {string} wavFilePath - Path to the WAV audio file
  * @returns {Promise<string>} - The transcribed text
  */
 export async function transcribeAudio(wavFilePath) {
-  const openai = new OpenAI({
-    apiKey: process.env.OPENAI_API_KEY
-  });
-
   if (!process.env.OPENAI_API_KEY) {
     throw new Error('OPENAI_API_KEY environment variable is required for transcription');
   }
 
+  const openai = getOpenAIClient();
+
   try {
     // Create a file stream for OpenAI
     const audioFile = fs.createReadStream(wavFilePath);
@@ -43,14 +53,12 @@ export async function transcribeAudio(wavFilePath) {
  * @returns {Promise<{score: number, explanation: string}>} - The evaluation score from 0 to 1 and explanation
  */
 export async function evaluateTranscription(transcription, evaluationPrompt) {
-  const openai = new OpenAI({
-    apiKey: process.env.OPENAI_API_KEY
-  });
-
   if (!process.env.OPENAI_API_KEY) {
     throw new Error('OPENAI_API_KEY environment variable is required for evaluation');
   }
 
+  const openai = getOpenAIClient();
+
   try {
     const response = await openai.chat.completions.create({
       model: "gpt-4o-mini",
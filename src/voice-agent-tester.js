@@ -5,24 +5,133 @@ import { glob } from 'glob';
 import puppeteer from 'puppeteer';
 import { launch as launchWithStream, getStream, wss } from 'puppeteer-stream';
 import { getInstalledBrowsers } from '@puppeteer/browsers';
+import { getBrowser } from './browser-pool.js';
 import { transcribeAudio, evaluateTranscription, pcmToWav } from './transcription.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
+// Injected scripts are listed and read from disk once and reused by every test run
+const jsFolder = path.join(__dirname, '..', 'javascript');
+let scriptFiles = null; // Promise of the script paths in jsFolder
+const scriptContents = new Map(); // Map of file path -> Promise of script source
+
+function listScripts() {
+  if (!scriptFiles) {
+    scriptFiles = fs.existsSync(jsFolder)
+      ? glob(path.join(jsFolder, '*.js'))
+      : Promise.resolve([]);
+    scriptFiles.catch(() => { scriptFiles = null; });
+  }
+  return scriptFiles;
+}
+
+function loadScript(jsFile) {
+  if (!scriptContents.has(jsFile)) {
+    const content = fs.promises.readFile(jsFile, 'utf8')
+      // Keep the file name visible in browser stack traces, as addScriptTag({ path }) does
+      .then(source => `${source}\n//# sourceURL=${jsFile.replace(/\n/g, '')}`);
+    content.catch(() => scriptContents.delete(jsFile));
+    scriptContents.set(jsFile, content);
+  }
+  return scriptContents.get(jsFile);
+}
+
+// Browser console messages are written in batches; beyond this many pending
+// messages new ones are dropped so a chatty page cannot grow the buffer unbounded
+const MAX_BUFFERED_CONSOLE_MESSAGES = 1024;
+
+// Functions evaluated in the page by the speak step. The text or URL is passed as an
+// argument rather than interpolated into the source
+async function speakFromUrlInPage(url) {
+  if (typeof window.__waitForMediaStream === 'function') {
+    try {
+      await window.__waitForMediaStream();
+    } catch (e) {
+      console.error(e.message);
+      throw e;
+    }
+  }
+
+  if (typeof window.__speakFromUrl === 'function') {
+    window.__speakFromUrl(url);
+  } else if (typeof window.__speak === 'function') {
+    window.__speak(url);
+  } else {
+    console.error('Neither __speakFromUrl nor __speak is available');
+    console.log('Available window properties:', Object.keys(window).filter(k => k.startsWith('__')));
+    throw new Error('__speakFromUrl method not available');
+  }
+}
+
+async function speakTextInPage(text) {
+  if (typeof window.__waitForMediaStream === 'function') {
+    try {
+      await window.__waitForMediaStream();
+    } catch (e) {
+      console.error(e.message);
+      throw e;
+    }
+  }
+
+  if (typeof window.__speak === 'function') {
+    window.__speak(text);
+  } else {
+    throw new Error('__speak method not available');
+  }
+}
+
+// Split steps into batches: consecutive steps with the same `group` value form one
+// batch that runs concurrently, every other step is a batch of its own
+function batchSteps(steps) {
+  const batches = [];
+  steps.forEach((step, index) => {
+    const lastBatch = batches.at(-1);
+    const hasGroup = step.group !== undefined && step.group !== null;
+    if (hasGroup && lastBatch && lastBatch[0].step.group === step.group) {
+      lastBatch.push({ step, index });
+    } else {
+      batches.push([{ step, index }]);
+    }
+  });
+  return batches;
+}
+
+// Step action -> VoiceAgentTester method that executes it
+const STEP_HANDLERS = new Map([
+  ['click', 'handleClick'],
+  ['wait_for_voice', 'handleWaitForVoice'],
+  ['wait_for_silence', 'handleWaitForSilence'],
+  ['wait', 'handleWait'],
+  ['speak', 'handleSpeak'],
+  ['listen', 'handleListen'],
+  ['sleep', 'handleSleep'],
+  ['wait_for_element', 'handleWaitForElement'],
+  ['type', 'handleType'],
+  ['fill', 'handleFill'],
+  ['select', 'handleSelect'],
+  ['screenshot', 'handleScreenshot']
+]);
+
 export class VoiceAgentTester {
   constructor(options = {}) {
     this.verbose = options.verbose || false;
     this.headless = options.headless || false;
     this.browser = null;
+    this.context = null;
     this.page = null;
     this.pendingPromises = new Map(); // Map of eventType -> Array of {resolve, reject, timeoutId}
     const defaultPort = process.env.HTTP_PORT || process.env.PORT || 3333;
     this.assetsServerUrl = options.assetsServerUrl || `http://localhost:${defaultPort}`;
     this.reportGenerator = options.reportGenerator || null;
     this.record = options.record || false;
+    this.cdpEndpoint = options.cdpEndpoint || null;
+    // Recording needs its own puppeteer-stream browser, so it never uses the shared one
+    this.reuseBrowser = (options.reuseBrowser || Boolean(this.cdpEndpoint)) && !this.record;
     this.recordingStream = null;
     this.recordingFile = null;
+    this.consoleBuffer = [];
+    this.droppedConsoleMessages = 0;
   }
 
   sleep(time) {
@@ -88,6 +197,10 @@ export class VoiceAgentTester {
         '--allow-running-insecure-content',
         '--no-first-run',
         '--no-default-browser-check',
+        // Keep background tabs running at full speed when several tests share a browser
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
         '--allowlisted-extension-id=jjndjgheafjngoipoacpjgeicjeomjli' // puppeteer-stream extension id
       ]
     };
@@ -102,22 +215,30 @@ export class VoiceAgentTester {
           .sort((a, b) => (a.buildId < b.buildId ? 1 : a.buildId > b.buildId ? -1 : 0))
           .at(0).executablePath
       });
+    } else if (this.reuseBrowser) {
+      this.browser = await getBrowser(launchOptions, this.cdpEndpoint);
     } else {
-      this.browser = await puppeteer.launch(launchOptions);
+      // A dedicated browser is never shared, so talk CDP over a pipe instead of a WebSocket
+      this.browser = await puppeteer.launch({ ...launchOptions, pipe: true });
     }
 
     // Log browser info
     const browserVersion = await this.browser.version();
     console.log(`Browser launched: ${browserVersion}`);
 
+    // Each test on a shared browser gets its own context, so cookies, storage and
+    // permissions never leak between repetitions or concurrent tests
+    this.context = this.reuseBrowser
+      ? await this.browser.createBrowserContext()
+      : this.browser.defaultBrowserContext();
+
     // Override permissions for media stream (only for http/https URLs, not data: or file: URLs)
     if (url && (url.startsWith('http://') || url.startsWith('https://'))) {
-      const context = this.browser.defaultBrowserContext();
-      await context.clearPermissionOverrides();
-      await context.overridePermissions(url, ['camera', 'microphone']);
+      await this.context.clearPermissionOverrides();
+      await this.context.overridePermissions(url, ['camera', 'microphone']);
     }
 
-    this.page = await this.browser.newPage();
+    this.page = await this.context.newPage();
 
     // Register __publishEvent function for browser to call back to Node.js
     await this.page.exposeFunction('__publishEvent', (eventType, data) => {
@@ -125,27 +246,21 @@ export class VoiceAgentTester {
 
       console.log(`\t📢 Event received: ${eventType}`);
 
-      // Check if there are any pending promises waiting for this event type
+      // Resolve every promise waiting for this event type, since steps of the same
+      // group can wait for the same event at the same time
       const pendingPromises = this.pendingPromises.get(eventType);
-      if (pendingPromises && pendingPromises.length > 0) {
-        // Resolve the first pending promise immediately
-        const { resolve, timeoutId } = pendingPromises.shift();
-        clearTimeout(timeoutId);
-
-        // Clean up empty arrays
-        if (pendingPromises.length === 0) {
-          this.pendingPromises.delete(eventType);
+      if (pendingPromises) {
+        this.pendingPromises.delete(eventType);
+        for (const { resolve, timeoutId } of pendingPromises) {
+          clearTimeout(timeoutId);
+          resolve(event);
         }
-
-        resolve(event);
       }
     });
 
     // Enable console logging if verbose mode is enabled
     if (this.verbose) {
-      this.page.on('console', (msg) => {
-        console.log(`[BROWSER] ${msg.text()}`);
-      });
+      this.page.on('console', (msg) => this.bufferConsoleMessage(msg.text()));
     }
 
     // Always listen for page errors
@@ -157,8 +272,36 @@ export class VoiceAgentTester {
     });
   }
 
+  bufferConsoleMessage(text) {
+    if (this.consoleBuffer.length >= MAX_BUFFERED_CONSOLE_MESSAGES) {
+      this.droppedConsoleMessages++;
+      return;
+    }
+
+    this.consoleBuffer.push(`[BROWSER] ${text}`);
+
+    // Write everything received in this turn of the event loop with a single call
+    if (this.consoleBuffer.length === 1) {
+      setImmediate(() => this.flushConsoleMessages());
+    }
+  }
+
+  flushConsoleMessages() {
+    if (this.droppedConsoleMessages > 0) {
+      this.consoleBuffer.push(`[BROWSER] ... ${this.droppedConsoleMessages} message(s) dropped`);
+      this.droppedConsoleMessages = 0;
+    }
+
+    if (this.consoleBuffer.length > 0) {
+      process.stdout.write(`${this.consoleBuffer.join('\n')}\n`);
+      this.consoleBuffer = [];
+    }
+  }
+
   async close() {
     if (this.browser) {
+      this.flushConsoleMessages();
+
       // Stop recording if active
       if (this.recordingStream) {
         await this.stopRecording();
@@ -173,9 +316,24 @@ export class VoiceAgentTester {
       }
       this.pendingPromises.clear();
 
-      await this.browser.close();
-      this.browser = null;
-      this.page = null;
+      // A shared browser stays open for the next test, only this test's context is closed
+      try {
+        if (!this.browser.connected) {
+          // The browser crashed or the connection dropped, there is nothing left to close
+        } else if (this.reuseBrowser) {
+          if (this.context) {
+            await this.context.close();
+          }
+        } else {
+          await this.browser.close();
+        }
+      } catch (error) {
+        // Ignore errors when the browser disconnects while closing, so the step error is kept
+      } finally {
+        this.browser = null;
+        this.context = null;
+        this.page = null;
+      }
 
       // Close the websocket server if recording was used
       if (this.record) {
@@ -195,9 +353,7 @@ export class VoiceAgentTester {
 
     // Ensure output directory exists
     const outputDir = path.join(__dirname, '..', 'output');
-    if (!fs.existsSync(outputDir)) {
-      fs.mkdirSync(outputDir, { recursive: true });
-    }
+    await fs.promises.mkdir(outputDir, { recursive: true });
 
     // Create filename with timestamp and test info
     const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
@@ -258,25 +414,26 @@ export class VoiceAgentTester {
       window.__assetsServerUrl = url;
     }, this.assetsServerUrl);
 
-    const jsFolder = path.join(__dirname, '..', 'javascript');
+    const jsFiles = await listScripts();
 
-    if (!fs.existsSync(jsFolder)) {
-      console.log('JavaScript folder not found, skipping injection');
+    if (jsFiles.length === 0) {
+      console.log('No JavaScript files found, skipping injection');
       return;
     }
 
-    const jsFiles = await glob(path.join(jsFolder, '*.js'));
+    // The hook scripts are independent, so inject them all at once
+    const results = await Promise.allSettled(
+      jsFiles.map(async jsFile => this.page.addScriptTag({ content: await loadScript(jsFile) }))
+    );
 
-    for (const jsFile of jsFiles) {
-      try {
-        await this.page.addScriptTag({ path: jsFile });
-        if (this.verbose) {
-          console.log(`Injected: ${path.basename(jsFile)}`);
-        }
-      } catch (error) {
-        console.error(`Error injecting ${jsFile}:`, error.message);
+    results.forEach((result, index) => {
+      const jsFile = jsFiles[index];
+      if (result.status === 'rejected') {
+        console.error(`Error injecting ${jsFile}:`, result.reason.message);
+      } else if (this.verbose) {
+        console.log(`Injected: ${path.basename(jsFile)}`);
       }
-    }
+    });
   }
 
   async executeStep(step, stepIndex, appName = '', scenarioName = '', repetition = 1) {
@@ -289,45 +446,11 @@ export class VoiceAgentTester {
 
     try {
       let handlerResult;
-      switch (action) {
-        case 'click':
-          handlerResult = await this.handleClick(step);
-          break;
-        case 'wait_for_voice':
-          handlerResult = await this.handleWaitForVoice();
-          break;
-        case 'wait_for_silence':
-          handlerResult = await this.handleWaitForSilence();
-          break;
-        case 'wait':
-          handlerResult = await this.handleWait(step);
-          break;
-        case 'speak':
-          handlerResult = await this.handleSpeak(step);
-          break;
-        case 'listen':
-          handlerResult = await this.handleListen(step);
-          break;
-        case 'sleep':
-          handlerResult = await this.handleSleep(step);
-          break;
-        case 'wait_for_element':
-          handlerResult = await this.handleWaitForElement(step);
-          break;
-        case 'type':
-          handlerResult = await this.handleType(step);
-          break;
-        case 'fill':
-          handlerResult = await this.handleFill(step);
-          break;
-        case 'select':
-          handlerResult = await this.handleSelect(step);
-          break;
-        case 'screenshot':
-          handlerResult = await this.handleScreenshot(step);
-          break;
-        default:
-          console.log(`Unknown action: ${action}`);
+      const handlerName = STEP_HANDLERS.get(action);
+      if (handlerName) {
+        handlerResult = await this[handlerName](step);
+      } else {
+        console.log(`Unknown action: ${action}`);
       }
 
       // Record elapsed time for all steps
@@ -365,18 +488,18 @@ export class VoiceAgentTester {
     await this.page.click(selector);
   }
 
-  async handleWaitForVoice() {
+  async handleWaitForVoice(step) {
     try {
-      await this.waitForAudioEvent('audiostart');
+      await this.waitForAudioEvent('audiostart', step.timeout);
     } catch (error) {
       console.error('Timeout waiting for voice input:', error.message);
       throw error;
     }
   }
 
-  async handleWaitForSilence() {
+  async handleWaitForSilence(step) {
     try {
-      await this.waitForAudioEvent('audiostop');
+      await this.waitForAudioEvent('audiostop', step.timeout);
     } catch (error) {
       console.error('Timeout waiting for silence:', error.message);
       throw error;
@@ -409,55 +532,17 @@ export class VoiceAgentTester {
       const assetsPath = path.join(__dirname, '..', 'assets');
       const filePath = path.join(assetsPath, file);
 
-      if (!fs.existsSync(filePath)) {
+      try {
+        await fs.promises.access(filePath);
+      } catch (error) {
         throw new Error(`Audio file not found: ${file}`);
       }
 
       const fileUrl = `${this.assetsServerUrl}/assets/${file}`;
 
-      await this.page.evaluate(async (url) => {
-        if (typeof window.__waitForMediaStream === 'function') {
-          try {
-            await window.__waitForMediaStream();
-          } catch (e) {
-            console.error(e.message);
-            throw e;
-          }
-        }
-
-        console.log('Checking for __speakFromUrl function...');
-        console.log('typeof window.__speakFromUrl:', typeof window.__speakFromUrl);
-        console.log('typeof window.__speak:', typeof window.__speak);
-
-        if (typeof window.__speakFromUrl === 'function') {
-          console.log('Calling __speakFromUrl with:', url);
-          window.__speakFromUrl(url);
-        } else if (typeof window.__speak === 'function') {
-          console.log('__speakFromUrl not available, but __speak is available. Calling __speak with URL:', url);
-          window.__speak(url);
-        } else {
-          console.error('Neither __speakFromUrl nor __speak is available');
-          console.log('Available window properties:', Object.keys(window).filter(k => k.startsWith('__')));
-          throw new Error('__speakFromUrl method not available');
-        }
-      }, fileUrl);
+      await this.page.evaluate(speakFromUrlInPage, fileUrl);
     } else {
-      await this.page.evaluate(async (textToSpeak) => {
-        if (typeof window.__waitForMediaStream === 'function') {
-          try {
-            await window.__waitForMediaStream();
-          } catch (e) {
-            console.error(e.message);
-            throw e;
-          }
-        }
-
-        if (typeof window.__speak === 'function') {
-          window.__speak(textToSpeak);
-        } else {
-          throw new Error('__speak method not available');
-        }
-      }, text);
+      await this.page.evaluate(speakTextInPage, text);
     }
 
     // Wait for speech to complete by listening for speechend event
@@ -721,9 +806,7 @@ export class VoiceAgentTester {
     const outputDir = step.outputDir || path.join(__dirname, '..', 'output');
 
     // Ensure output directory exists
-    if (!fs.existsSync(outputDir)) {
-      fs.mkdirSync(outputDir, { recursive: true });
-    }
+    await fs.promises.mkdir(outputDir, { recursive: true });
 
     const screenshotPath = path.join(outputDir, filename);
 
@@ -747,13 +830,11 @@ export class VoiceAgentTester {
 
       // Save to file
       const outputDir = path.join(__dirname, '..', 'output');
-      if (!fs.existsSync(outputDir)) {
-        fs.mkdirSync(outputDir, { recursive: true });
-      }
+      await fs.promises.mkdir(outputDir, { recursive: true });
 
       const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
       const wavFilePath = path.join(outputDir, `recording_${timestamp}.wav`);
-      fs.writeFileSync(wavFilePath, wavBuffer);
+      await fs.promises.writeFile(wavFilePath, wavBuffer);
 
       return wavFilePath;
     } catch (error) {
@@ -762,6 +843,21 @@ export class VoiceAgentTester {
     }
   }
 
+  async executeSteps(steps, appName = '', scenarioName = '', repetition = 1) {
+    for (const batch of batchSteps(steps)) {
+      const results = await Promise.allSettled(batch.map(({ step, index }) => {
+        console.log(`Executing step ${index + 1}: ${JSON.stringify(step)}`);
+        return this.executeStep(step, index, appName, scenarioName, repetition);
+      }));
+
+      // Wait for the whole batch before failing so no step is still using the page
+      const failure = results.find(result => result.status === 'rejected');
+      if (failure) {
+        throw failure.reason;
+      }
+    }
+  }
+
   async runScenario(url, appSteps, scenarioSteps, appName = '', scenarioName = '', repetition = 1, backgroundFile = null) {
     let success = true;
     try {
@@ -777,23 +873,17 @@ export class VoiceAgentTester {
 
       await this.page.goto(url, { waitUntil: 'load' });
 
-      // Inject JavaScript files after the page has loaded
+      // Inject JavaScript files after the page has loaded. addScriptTag only resolves
+      // once each script has run, so the hooks are ready when this returns
       await this.injectJavaScriptFiles();
 
       await this.page.waitForNetworkIdle({ timeout: 5000, concurrency: 2 });
 
-      // Small wait to ensure injected scripts are fully loaded
-      await this.sleep(500);
-
       // Start recording if enabled
       await this.startRecording(appName, scenarioName, repetition);
 
       // Execute all configured steps
-      for (let i = 0; i < steps.length; i++) {
-        const step = steps[i];
-        console.log(`Executing step ${i + 1}: ${JSON.stringify(step)}`);
-        await this.executeStep(step, i, appName, scenarioName, repetition);
-      }
+      await this.executeSteps(steps, appName, scenarioName, repetition);
 
       // Keep the browser open for a bit after all steps
       await this.sleep(500);
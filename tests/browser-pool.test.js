@@ -0,0 +1,105 @@
+import { describe, test, expect, afterEach } from '@jest/globals';
+import puppeteer from 'puppeteer';
+import { VoiceAgentTester } from '../src/voice-agent-tester.js';
+import { closeBrowser } from '../src/browser-pool.js';
+
+describe('Shared browser', () => {
+  const testers = [];
+
+  function createTester(options = {}) {
+    const tester = new VoiceAgentTester({
+      verbose: false,
+      headless: true,
+      reuseBrowser: true,
+      ...options
+    });
+    testers.push(tester);
+    return tester;
+  }
+
+  afterEach(async () => {
+    for (const tester of testers.splice(0)) {
+      await tester.close();
+    }
+    await closeBrowser();
+  });
+
+  test('should share one browser between testers', async () => {
+    const testUrl = 'data:text/html,<html><body></body></html>';
+    const firstTester = createTester();
+    const secondTester = createTester();
+
+    await firstTester.launch(testUrl);
+    await secondTester.launch(testUrl);
+
+    expect(firstTester.browser).toBe(secondTester.browser);
+    expect(firstTester.page).not.toBe(secondTester.page);
+  });
+
+  test('should give each tester its own browser context', async () => {
+    const testUrl = 'data:text/html,<html><body></body></html>';
+    const firstTester = createTester();
+    const secondTester = createTester();
+
+    await firstTester.launch(testUrl);
+    await secondTester.launch(testUrl);
+    const browser = firstTester.browser;
+
+    expect(firstTester.context).not.toBe(secondTester.context);
+    expect(firstTester.context).not.toBe(browser.defaultBrowserContext());
+
+    // Closing a tester only closes its context, the browser stays open for other tests
+    await firstTester.close();
+    await secondTester.close();
+    expect(browser.connected).toBe(true);
+    expect(browser.browserContexts()).toEqual([browser.defaultBrowserContext()]);
+  });
+
+  test('should close the shared browser with closeBrowser', async () => {
+    const testUrl = 'data:text/html,<html><body></body></html>';
+    const tester = createTester();
+
+    await tester.launch(testUrl);
+    const browser = tester.browser;
+    await tester.close();
+
+    await closeBrowser();
+    expect(browser.connected).toBe(false);
+  });
+
+  test('should close a tester after the shared browser is gone and launch a new one', async () => {
+    const testUrl = 'data:text/html,<html><body></body></html>';
+    const tester = createTester();
+
+    await tester.launch(testUrl);
+    const browser = tester.browser;
+    await closeBrowser();
+
+    await tester.close();
+    expect(tester.browser).toBeNull();
+    expect(tester.context).toBeNull();
+    expect(tester.page).toBeNull();
+
+    const nextTester = createTester();
+    await nextTester.launch(testUrl);
+    expect(nextTester.browser).not.toBe(browser);
+    expect(nextTester.browser.connected).toBe(true);
+  });
+
+  test('should attach to a running browser with cdpEndpoint and only disconnect from it', async () => {
+    const runningBrowser = await puppeteer.launch({ headless: true, args: ['--no-sandbox'] });
+
+    try {
+      const testUrl = 'data:text/html,<html><body><div id="ready">Ready</div></body></html>';
+      const tester = createTester({ reuseBrowser: false, cdpEndpoint: runningBrowser.wsEndpoint() });
+
+      await tester.runScenario(testUrl, [], [{ action: 'wait', selector: '#ready' }], 'test-app', 'test-scenario', 1);
+      await closeBrowser();
+
+      expect(runningBrowser.connected).toBe(true);
+      expect((await runningBrowser.version()).length).toBeGreaterThan(0);
+    } finally {
+      await runningBrowser.close();
+    }
+  });
+});
@@ -0,0 +1,78 @@
+import { describe, test, expect, beforeEach, afterEach } from '@jest/globals';
+import { loadYamlCached } from '../src/config-cache.js';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+
+describe('loadYamlCached', () => {
+  let tempDir;
+  let cacheDir;
+  let configPath;
+
+  beforeEach(() => {
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'config-cache-'));
+    cacheDir = path.join(tempDir, 'cache');
+    configPath = path.join(tempDir, 'scenario.yaml');
+    fs.writeFileSync(configPath, 'steps:\n  - action: sleep\n    time: 100\n');
+  });
+
+  afterEach(() => {
+    fs.rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  test('should parse YAML and store it in the cache', () => {
+    const config = loadYamlCached(configPath, cacheDir);
+
+    expect(config).toEqual({ steps: [{ action: 'sleep', time: 100 }] });
+    expect(fs.readdirSync(cacheDir)).toHaveLength(1);
+  });
+
+  test('should parse JSON and YAML flow mappings', () => {
+    const jsonPath = path.join(tempDir, 'app.json');
+    fs.writeFileSync(jsonPath, '{"url": "http://localhost:8080", "steps": []}');
+    expect(loadYamlCached(jsonPath, cacheDir)).toEqual({ url: 'http://localhost:8080', steps: [] });
+
+    const flowPath = path.join(tempDir, 'flow.yaml');
+    fs.writeFileSync(flowPath, '{url: http://localhost:8080, steps: []}');
+    expect(loadYamlCached(flowPath, cacheDir)).toEqual({ url: 'http://localhost:8080', steps: [] });
+  });
+
+  test('should return the same object when the file is unchanged', () => {
+    const config = loadYamlCached(configPath, cacheDir);
+
+    expect(loadYamlCached(configPath, cacheDir)).toBe(config);
+  });
+
+  test('should return the cached result from a previous run', () => {
+    loadYamlCached(configPath, cacheDir);
+
+    // Tamper with a copy of the cache entry, in a folder this process has not loaded
+    // from yet, to prove it is used instead of the YAML file
+    const entryName = fs.readdirSync(cacheDir)[0];
+    const entry = JSON.parse(fs.readFileSync(path.join(cacheDir, entryName), 'utf8'));
+    const otherCacheDir = path.join(tempDir, 'other-cache');
+    fs.mkdirSync(otherCacheDir);
+    fs.writeFileSync(path.join(otherCacheDir, entryName), JSON.stringify({ ...entry, config: { cached: true } }));
+
+    expect(loadYamlCached(configPath, otherCacheDir)).toEqual({ cached: true });
+  });
+
+  test('should parse the file again after it changes', () => {
+    loadYamlCached(configPath, cacheDir);
+
+    fs.writeFileSync(configPath, 'steps:\n  - action: click\n    selector: "#start"\n');
+
+    expect(loadYamlCached(configPath, cacheDir)).toEqual({
+      steps: [{ action: 'click', selector: '#start' }]
+    });
+  });
+
+  test('should overwrite the cache entry after the file changes', () => {
+    loadYamlCached(configPath, cacheDir);
+
+    fs.writeFileSync(configPath, 'steps: []\n');
+    loadYamlCached(configPath, cacheDir);
+
+    expect(fs.readdirSync(cacheDir)).toHaveLength(1);
+  });
+});
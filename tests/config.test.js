@@ -0,0 +1,61 @@
+import { describe, test, expect, beforeEach, afterEach } from '@jest/globals';
+import { loadApplicationConfig, loadScenarioConfig } from '../src/config.js';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+
+describe('Config loading', () => {
+  let tempDir;
+  let cacheDir;
+
+  function writeConfig(name, content) {
+    const configPath = path.join(tempDir, name);
+    fs.writeFileSync(configPath, content);
+    return configPath;
+  }
+
+  beforeEach(() => {
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'config-'));
+    cacheDir = path.join(tempDir, 'cache');
+  });
+
+  afterEach(() => {
+    fs.rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  test('should load an application config', () => {
+    const configPath = writeConfig('app.yaml', 'url: http://localhost:8080\nsteps:\n  - action: click\n    selector: "#start"\n');
+
+    const app = loadApplicationConfig(configPath, cacheDir);
+
+    expect(app.name).toBe('app');
+    expect(app.url).toBe('http://localhost:8080');
+    expect(app.steps).toEqual([{ action: 'click', selector: '#start' }]);
+  });
+
+  test('should reject steps that are not a list', () => {
+    const configPath = writeConfig('scenario.yaml', 'steps:\n  action: click\n');
+
+    expect(() => loadScenarioConfig(configPath, cacheDir))
+      .toThrow(`"steps" must be a list: ${configPath}`);
+  });
+
+  test('should reject a step without an action', () => {
+    const configPath = writeConfig('scenario.yaml', 'steps:\n  - action: sleep\n    time: 100\n  - selector: "#start"\n');
+
+    expect(() => loadScenarioConfig(configPath, cacheDir))
+      .toThrow(`Step 2 must contain an "action" field: ${configPath}`);
+  });
+
+  test('should return an immutable config', () => {
+    const configPath = writeConfig('scenario.yaml', 'steps:\n  - action: sleep\n    time: 100\n');
+
+    const scenario = loadScenarioConfig(configPath, cacheDir);
+
+    expect(Object.isFrozen(scenario)).toBe(true);
+    expect(Object.isFrozen(scenario.steps)).toBe(true);
+    expect(Object.isFrozen(scenario.steps[0])).toBe(true);
+    expect(() => { scenario.steps[0].time = 200; }).toThrow(TypeError);
+    expect(() => scenario.steps.push({ action: 'click' })).toThrow(TypeError);
+  });
+});
@@ -146,6 +146,61 @@ describe('VoiceAgentTester', () => {
     expect(speechText).toBe('Hello, this is a test');
   });
 
+  test('should fail wait_for_voice after the step timeout', async () => {
+    const testUrl = 'data:text/html,<html><body></body></html>';
+    await tester.launch(testUrl);
+    await tester.page.goto(testUrl);
+
+    await expect(tester.executeStep({ action: 'wait_for_voice', timeout: 100 }, 0, 'scenario'))
+      .rejects.toThrow('Timeout waiting for audiostart event after 100ms');
+  });
+
+  test('should run steps of the same group concurrently', async () => {
+    const testUrl = 'data:text/html,<html><body></body></html>';
+    await tester.launch(testUrl);
+    await tester.page.goto(testUrl);
+
+    const beginTime = Date.now();
+    await tester.executeSteps([
+      { action: 'sleep', time: 300, group: 1 },
+      { action: 'sleep', time: 300, group: 1 }
+    ]);
+
+    // Sequential execution would take at least 600ms
+    expect(Date.now() - beginTime).toBeLessThan(550);
+  });
+
+  test('should resolve every step of a group waiting for the same event', async () => {
+    const testUrl = 'data:text/html,<html><body></body></html>';
+    await tester.launch(testUrl);
+    await tester.page.goto(testUrl);
+
+    // Publish a single audiostart event once both steps are waiting
+    await tester.page.evaluate(() => {
+      setTimeout(() => window.__publishEvent('audiostart', {}), 100);
+    });
+
+    await tester.executeSteps([
+      { action: 'wait_for_voice', timeout: 2000, group: 1 },
+      { action: 'wait_for_voice', timeout: 2000, group: 1 }
+    ]);
+  });
+
+  test('should fail a group only after all its steps finish', async () => {
+    const testUrl = 'data:text/html,<html><body></body></html>';
+    await tester.launch(testUrl);
+    await tester.page.goto(testUrl);
+
+    const beginTime = Date.now();
+    await expect(tester.executeSteps([
+      { action: 'click', group: 1 },
+      { action: 'sleep', time: 300, group: 1 }
+    ])).rejects.toThrow('No selector specified for click action');
+
+    // The click fails immediately, but the sleep in the same group still completes
+    expect(Date.now() - beginTime).toBeGreaterThanOrEqual(290);
+  });
+
   test('should handle unknown action gracefully', async () => {
     const testUrl = 'data:text/html,<html><body></body></html>';
     await tester.launch(testUrl);